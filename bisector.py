@@ -316,17 +316,17 @@ class Bisector:
         self.steps = 0
         # check cache
         possible_revs = repo.direct_first_parent_path(good_rev, bad_rev)
-        cached_revs = find_cached_revisions(
-            case.bad_setting.compiler_project.to_string(), self.config
+        cached = set(
+            find_cached_revisions(
+                case.bad_setting.compiler_project.to_string(), self.config
+            )
         )
-        cached_revs = [r for r in cached_revs if r in possible_revs]
-
-        # Create enumeration dict to sort cached_revs with
-        sort_dict = dict((r, v) for v, r in enumerate(possible_revs))
-        cached_revs = sorted(cached_revs, key=lambda x: sort_dict[x])
+        # possible_revs is already in the order of the parent relation,
+        # so filtering it keeps cached_revs sorted without a sort.
+        cached_revs = [r for r in possible_revs if r in cached]
 
         # bisect in cache
-        len_region = len(repo.direct_first_parent_path(good_rev, bad_rev))
+        len_region = len(possible_revs)
         logging.info(f"Bisecting in cache...")
         midpoint = ""
         old_midpoint = ""
@@ -377,11 +377,11 @@ class Bisector:
                     bad_rev = midpoint
                     cached_revs = cached_revs[midpoint_idx + 1 :]
 
-        len_region2 = len(repo.direct_first_parent_path(good_rev, bad_rev))
+        len_region2 = utils.count_first_parent_path(repo, good_rev, bad_rev)
         logging.info(f"Cache bisection: range size {len_region} -> {len_region2}")
 
         # bisect
-        len_region = len(repo.direct_first_parent_path(good_rev, bad_rev))
+        len_region = len_region2
         logging.info(f"Bisecting for approx. {math.ceil(math.log2(len_region))} steps")
         midpoint = ""
         old_midpoint = ""
@@ -403,14 +403,14 @@ class Bisector:
                     )
                 if failed_to_build_counter % 2 == 0:
                     # Get size of range
-                    range_size = len(repo.direct_first_parent_path(midpoint, bad_rev))
+                    range_size = utils.count_first_parent_path(repo, midpoint, bad_rev)
 
                     # Move 10% towards the last bad
                     step = max(int(0.9 * range_size), 1)
                     midpoint = repo.rev_to_commit(f"{bad_rev}~{step}")
                 else:
                     # Symmetric to case above but jumping 10% into the other directory i.e 20% from our position.
-                    range_size = len(repo.direct_first_parent_path(good_rev, midpoint))
+                    range_size = utils.count_first_parent_path(repo, good_rev, midpoint)
                     step = max(int(0.2 * range_size), 1)
                     midpoint = repo.rev_to_commit(f"{midpoint}~{step}")
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import copy
+import functools
 import logging
 import os
 import re
@@ -56,6 +57,47 @@ def get_cc_output(cc: str, file: Path, flags: str, cc_timeout: int) -> tuple[int
     return result.returncode, result.stdout.decode("utf-8")
 
 
+# Substrings of gcc/clang warnings which hint at undefined behaviour
+_ub_warnings = (
+    "conversions than data arguments",
+    "incompatible redeclaration",
+    "ordered comparison between pointer",
+    "eliding middle term",
+    "end of non-void function",
+    "invalid in C99",
+    "specifies type",
+    "should return a value",
+    "uninitialized",
+    "incompatible pointer to",
+    "incompatible integer to",
+    "comparison of distinct pointer types",
+    "type specifier missing",
+    "Wimplicit-int",
+    "division by zero",
+    "without a cast",
+    "control reaches end",
+    "return type defaults",
+    "cast from pointer to integer",
+    "useless type name in empty declaration",
+    "no semicolon at end",
+    "type defaults to",
+    "too few arguments for format",
+    "incompatible pointer",
+    "ordered comparison of pointer with integer",
+    "declaration does not declare anything",
+    "expects type",
+    "pointer from integer",
+    "incompatible implicit",
+    "excess elements in struct initializer",
+    "comparison between pointer and integer",
+    "return type of ‘main’ is not ‘int’",
+    "past the end of the array",
+    "no return statement in function returning non-void",
+    "undefined behavior",
+)
+_ub_warnings_regex = re.compile("|".join(re.escape(w) for w in _ub_warnings))
+
+
 def check_compiler_warnings(
     clang: str, gcc: str, file: Path, flags: str, cc_timeout: int
 ) -> bool:
@@ -79,49 +121,10 @@ def check_compiler_warnings(
     if clang_rc != 0 or gcc_rc != 0:
         return False
 
-    warnings = [
-        "conversions than data arguments",
-        "incompatible redeclaration",
-        "ordered comparison between pointer",
-        "eliding middle term",
-        "end of non-void function",
-        "invalid in C99",
-        "specifies type",
-        "should return a value",
-        "uninitialized",
-        "incompatible pointer to",
-        "incompatible integer to",
-        "comparison of distinct pointer types",
-        "type specifier missing",
-        "uninitialized",
-        "Wimplicit-int",
-        "division by zero",
-        "without a cast",
-        "control reaches end",
-        "return type defaults",
-        "cast from pointer to integer",
-        "useless type name in empty declaration",
-        "no semicolon at end",
-        "type defaults to",
-        "too few arguments for format",
-        "incompatible pointer",
-        "ordered comparison of pointer with integer",
-        "declaration does not declare anything",
-        "expects type",
-        "comparison of distinct pointer types",
-        "pointer from integer",
-        "incompatible implicit",
-        "excess elements in struct initializer",
-        "comparison between pointer and integer",
-        "return type of ‘main’ is not ‘int’",
-        "past the end of the array",
-        "no return statement in function returning non-void",
-        "undefined behavior",
-    ]
-
-    ws = [w for w in warnings if w in clang_output or w in gcc_output]
-    if len(ws) > 0:
-        logging.debug(f"Compiler warnings found: {ws}")
+    ws = set(_ub_warnings_regex.findall(clang_output))
+    ws.update(_ub_warnings_regex.findall(gcc_output))
+    if ws:
+        logging.debug(f"Compiler warnings found: {sorted(ws)}")
         return False
 
     return True
@@ -132,8 +135,9 @@ class CCompEnv:
         self.td: tempfile.TemporaryDirectory[str]
 
     def __enter__(self) -> Path:
+        # Callers put their files into the returned directory explicitly, so
+        # tempfile.tempdir is left alone (unlike reducer.TempDirEnv).
         self.td = tempfile.TemporaryDirectory()
-        tempfile.tempdir = self.td.name
         return Path(self.td.name)
 
     def __exit__(
@@ -142,7 +146,7 @@ class CCompEnv:
         exc_value: Optional[BaseException],
         exc_traceback: Optional[TracebackType],
     ) -> None:
-        tempfile.tempdir = None
+        self.td.cleanup()
 
 
 def verify_with_ccomp(
@@ -204,31 +208,28 @@ def use_ub_sanitizers(
     if flags:
         cmd.extend(flags.split())
 
-    with CCompEnv():
-        with tempfile.NamedTemporaryFile(suffix=".exe", delete=False) as exe:
-            exe.close()
-            os.chmod(exe.name, 0o777)
-            cmd.append(f"-o{exe.name}")
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=cc_timeout,
-            )
-            if result.returncode != 0:
-                logging.debug(f"UB Sanitizer returncode {result.returncode}")
-                if os.path.exists(exe.name):
-                    os.remove(exe.name)
-                return False
-            result = subprocess.run(
-                exe.name,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=exe_timeout,
-            )
-            os.remove(exe.name)
+    with CCompEnv() as tmpdir:
+        # The directory is fresh and removed on exit, so a fixed name is
+        # enough and clang creates the executable with the right mode.
+        exe = str(tmpdir / "sanitized.exe")
+        cmd.append(f"-o{exe}")
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=cc_timeout,
+        )
+        if result.returncode != 0:
             logging.debug(f"UB Sanitizer returncode {result.returncode}")
-            return result.returncode == 0
+            return False
+        result = subprocess.run(
+            exe,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=exe_timeout,
+        )
+        logging.debug(f"UB Sanitizer returncode {result.returncode}")
+        return result.returncode == 0
 
 
 def sanitize(
@@ -269,6 +270,11 @@ def sanitize(
 # ==================== Checker ====================
 
 
+@functools.lru_cache(maxsize=16)
+def _marker_decl_regex(marker_prefix: str) -> re.Pattern[str]:
+    return re.compile(rf"^void {marker_prefix}(.*)\((void|)\);(.*)$", re.MULTILINE)
+
+
 class Checker:
     def __init__(self, config: utils.NestedNamespace, bldr: Builder):
         self.config = config
@@ -323,7 +329,7 @@ class Checker:
 
             # TODO: Handle include_paths better
             include_paths = utils.find_include_paths(
-                self.config.llvm.sane_version, tf.name, case.bad_setting.get_flag_str()
+                self.config.llvm.sane_version, case.bad_setting.get_flag_str()
             )
             cmd = [self.config.ccc, tf.name, "--from=main", f"--to={case.marker}"]
 
@@ -366,34 +372,27 @@ class Checker:
             with open(tf.name, "r") as annotated_file:
                 static_code = annotated_file.read()
 
-            asm_bad = utils.get_asm_str(static_code, case.bad_setting, self.builder)
             uninteresting = False
-            if case.marker not in asm_bad:
+            if not utils.is_marker_in_asm(
+                static_code, case.bad_setting, case.marker, self.builder
+            ):
                 uninteresting = True
             for good_setting in case.good_settings:
-                asm_good = utils.get_asm_str(static_code, good_setting, self.builder)
-                if case.marker in asm_good:
+                if utils.is_marker_in_asm(
+                    static_code, good_setting, case.marker, self.builder
+                ):
                     uninteresting = True
                     break
             return not uninteresting
 
     def _empty_marker_code_str(self, case: utils.Case) -> str:
         marker_prefix = utils.get_marker_prefix(case.marker)
-        p = re.compile(rf"void {marker_prefix}(.*)\((void|)\);(.*)")
-        empty_body_code = ""
-        for line in case.code.split("\n"):
-            m = p.match(line)
-            if m:
-                empty_body_code += (
-                    "\n"
-                    + rf"void {marker_prefix}{m.group(1)}({m.group(2)}){{}}"
-                    + "\n"
-                    + rf"{m.group(3)}"
-                )
-            else:
-                empty_body_code += f"\n{line}"
-
-        return empty_body_code
+        p = _marker_decl_regex(marker_prefix)
+        # One pass over the whole code instead of rebuilding it line by line
+        return "\n" + p.sub(
+            lambda m: f"void {marker_prefix}{m.group(1)}({m.group(2)}){{}}\n{m.group(3)}",
+            case.code,
+        )
 
     def is_interesting_with_empty_marker_bodies(self, case: utils.Case) -> bool:
         """Check if `case.code` does not exhibit undefined behaviour,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -10,26 +11,30 @@ import subprocess
 from multiprocessing import Process, Queue
 from os.path import join as pjoin
 from pathlib import Path
-from random import randint
-from tempfile import NamedTemporaryFile
+from random import getrandbits
+from tempfile import mkstemp
 from typing import TYPE_CHECKING, Generator, Optional, Union
 
 from ccbuilder import Builder, PatchDB, get_compiler_info
 from dead_instrumenter.instrumenter import instrument_program
+from dead_instrumenter.utils import Binary, find_binary
 
 import checker
 import parsers
 import utils
 
 
-def run_csmith(csmith: str) -> str:
+def run_csmith(csmith: str, max_size: Optional[int] = None) -> Optional[bytes]:
     """Generate random code with csmith.
 
     Args:
         csmith (str): Path to executable or name in $PATH to csmith.
+        max_size (Optional[int]): If given, csmith is killed as soon as its
+            output exceeds this many bytes.
 
     Returns:
-        str: csmith generated program.
+        Optional[bytes]: csmith generated program, not decoded. None if it
+            was larger than `max_size`.
     """
     tries = 0
     while True:
@@ -65,20 +70,47 @@ def run_csmith(csmith: str) -> str:
             "--no-volatiles",
             "--no-volatile-pointers",
         ]
-        for option in options:
-            if randint(0, 1):
+        # One random bit per option
+        bits = getrandbits(len(options))
+        for i, option in enumerate(options):
+            if (bits >> i) & 1:
                 cmd.append(f"--{option}")
             else:
                 cmd.append(f"--no-{option}")
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        if result.returncode == 0:
-            return result.stdout.decode("utf-8")
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        ) as proc:
+            assert proc.stdout is not None
+            if max_size is None:
+                output = proc.stdout.read()
+            else:
+                output = proc.stdout.read(max_size + 1)
+                if len(output) > max_size:
+                    # No need to wait for a program we'll reject anyway
+                    proc.kill()
+                    proc.wait()
+                    return None
+            returncode = proc.wait()
+        if returncode == 0:
+            return output
         else:
             tries += 1
             if tries > 10:
                 raise Exception("CSmith failed 10 times in a row!")
 
 
+@functools.cache
+def get_instrumenter_binaries() -> tuple[str, str]:
+    """Resolve the instrumenter and the clang it uses.
+    Without passing them explicitly, `instrument_program` re-reads the
+    instrumenter config and runs `dead-instrument --version` on every call.
+
+    Returns:
+        tuple[str, str]: Paths to the instrumenter and to clang.
+    """
+    return find_binary(Binary.INSTRUMENTER), find_binary(Binary.CLANG)
+
+
 def generate_file(
     config: utils.NestedNamespace, additional_flags: str
 ) -> tuple[str, str]:
@@ -92,35 +124,45 @@ def generate_file(
     Returns:
         tuple[str, str]: Marker prefix and instrumented code.
     """
-    additional_flags += f" -I {config.csmith.include_path}"
+    include_flag = f"-I{config.csmith.include_path}"
+    additional_flags = f"{additional_flags} {include_flag}"
     while True:
         try:
             logging.debug("Generating new candidate...")
-            candidate = run_csmith(config.csmith.executable)
-            if len(candidate) > config.csmith.max_size:
+            candidate = run_csmith(
+                config.csmith.executable, max_size=config.csmith.max_size
+            )
+            if candidate is None:
                 continue
             if len(candidate) < config.csmith.min_size:
                 continue
-            with NamedTemporaryFile(suffix=".c") as ntf:
-                with open(ntf.name, "w") as f:
-                    print(candidate, file=f)
+            fd, candidate_file = mkstemp(suffix=".c")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(candidate)
                 logging.debug("Checking if program is sane...")
                 if not checker.sanitize(
                     config.gcc.sane_version,
                     config.llvm.sane_version,
                     config.ccomp,
-                    Path(ntf.name),
+                    Path(candidate_file),
                     additional_flags,
                 ):
                     continue
                 logging.debug("Instrumenting candidate...")
+                instrumenter, clang = get_instrumenter_binaries()
                 marker_prefix = instrument_program(
-                    Path(ntf.name), [f"-I{config.csmith.include_path}"]
+                    Path(candidate_file),
+                    [include_flag],
+                    instrumenter=Path(instrumenter),
+                    clang=Path(clang),
                 )
-                with open(ntf.name, "r") as f:
+                # Reopen by name: the instrumenter may replace the file
+                # instead of rewriting it.
+                with open(candidate_file, "r") as f:
                     return marker_prefix, f.read()
-
-            return marker_prefix, candidate
+            finally:
+                os.unlink(candidate_file)
         except subprocess.TimeoutExpired:
             pass
 
@@ -195,13 +237,18 @@ class CSmithCaseGenerator:
             except utils.CompileError:
                 continue
 
-            target_alive_markers = set()
-            for _, marker_set in target_alive_marker_list:
-                target_alive_markers.update(marker_set)
+            # Index which target settings keep each marker alive, so the
+            # settings don't have to be scanned again for every marker
+            target_settings_with_marker: dict[str, list[utils.CompilerSetting]] = {}
+            for target_setting, marker_set in target_alive_marker_list:
+                for marker in marker_set:
+                    target_settings_with_marker.setdefault(marker, []).append(
+                        target_setting
+                    )
 
             # Extract reduce cases
             logging.debug("Extracting reduce cases...")
-            for marker in target_alive_markers:
+            for marker, bad_settings in target_settings_with_marker.items():
                 good: list[utils.CompilerSetting] = []
                 for good_setting, good_alive_markers in tester_alive_marker_list:
                     if (
@@ -211,13 +258,11 @@ class CSmithCaseGenerator:
 
                 # Find bad cases
                 if len(good) > 0:
-                    good_opt_levels = [gs.opt_level for gs in good]
-                    for bad_setting, bad_alive_markers in target_alive_marker_list:
+                    good_opt_levels = {gs.opt_level for gs in good}
+                    # bad_settings are the ones which didn't eliminate the call
+                    for bad_setting in bad_settings:
                         # XXX: Here you can enable inter-opt_level comparison!
-                        if (
-                            marker in bad_alive_markers
-                            and bad_setting.opt_level in good_opt_levels
-                        ):  # i.e. the setting didn't eliminate the call
+                        if bad_setting.opt_level in good_opt_levels:
                             # Create reduce case
                             case = utils.Case(
                                 code=candidate_code,
@@ -317,6 +362,9 @@ class CSmithCaseGenerator:
 
         queue: Queue[str] = Queue()
 
+        # Resolve once here so the forked workers inherit the result
+        get_instrumenter_binaries()
+
         # Create processes
         self.procs = [
             Process(
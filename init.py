@@ -3,7 +3,6 @@
 import grp
 import json
 import os
-import shutil
 import stat
 from pathlib import Path
 from typing import Any
@@ -22,7 +21,7 @@ def main() -> None:
 
     not_found = []
     for p in ["clang", "gcc", "cmake", "ccomp", "csmith", "creduce"]:
-        if not shutil.which(p):
+        if not utils.which(p):
             not_found.append(p)
 
     if not_found:
@@ -37,7 +36,7 @@ def main() -> None:
 
     print("Creating default ~/.config/dead/config.json...")
 
-    path = Path.home() / ".config/dead/config.json"
+    path = utils.DEFAULT_CONFIG_PATH
     if path.exists():
         print(f"{path} already exists! Aborting to prevent overriding data...")
         exit(1)
@@ -54,7 +53,7 @@ def main() -> None:
         utils.run_cmd("git clone git://gcc.gnu.org/git/gcc.git")
     gcc["repo"] = "./gcc"
 
-    if shutil.which("gcc"):
+    if utils.which("gcc"):
         gcc["sane_version"] = "gcc"
     else:
         gcc["sane_version"] = "???"
@@ -98,7 +97,7 @@ def main() -> None:
         utils.run_cmd("git clone https://github.com/llvm/llvm-project")
     llvm["repo"] = "./llvm-project"
 
-    if shutil.which("clang"):
+    if utils.which("clang"):
         llvm["sane_version"] = "clang"
     else:
         llvm["sane_version"] = "???"
@@ -144,15 +143,16 @@ def main() -> None:
     csmith: dict[str, Any] = {}
     csmith["max_size"] = 50000
     csmith["min_size"] = 10000
-    if shutil.which("csmith"):
+    if utils.which("csmith"):
         csmith["executable"] = "csmith"
-        res = utils.run_cmd("csmith --version")
-        # $ csmith --version csmith 2.3.0
-        # Git version: 30dccd7
-        version = res.split("\n")[0].split()[1]
         if Path("/usr/include/csmith").exists():
             csmith["include_path"] = "/usr/include/csmith"
         else:
+            # The version is only needed for the versioned include path
+            res = utils.run_cmd("csmith --version")
+            # $ csmith --version csmith 2.3.0
+            # Git version: 30dccd7
+            version = res.split("\n", 1)[0].split()[1]
             csmith["include_path"] = "/usr/include/csmith-" + version
     else:
         print(
@@ -185,14 +185,14 @@ def main() -> None:
     config["cachedir"] = "./compiler_cache"
 
     config["creduce"] = "creduce"
-    if not shutil.which("creduce"):
+    if not utils.which("creduce"):
         print(
             "creduce was not found in $PATH. You have to specify the executable yourself"
         )
         config["creduce"] = "???"
 
     config["ccomp"] = "ccomp"
-    if not shutil.which("ccomp"):
+    if not utils.which("ccomp"):
         print(
             "ccomp was not found in $PATH. You have to specify the executable yourself"
         )
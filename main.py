@@ -7,11 +7,13 @@ import logging
 import os
 import random
 import re
+import shlex
 import subprocess
 import sys
 import tempfile
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
@@ -245,23 +247,24 @@ def _absorb() -> None:
     if Path(args.absorb_object).is_file():
         read_into_db(Path(args.absorb_object))
         exit(0)
-    pool = Pool(10)
+    processes = 10
+    pool = Pool(processes)
 
     absorb_directory = Path(args.absorb_object).absolute()
     paths = [p for p in absorb_directory.iterdir() if p.match("*.tar")]
     len_paths = len(paths)
+    # Hand out the cases in batches instead of one IPC round trip per case
+    chunksize = max(1, len_paths // (processes * 4))
     len_len_paths = len(str(len_paths))
     print("Absorbing... ", end="", flush=True)
     status_str = ""
     counter = 0
     start_time = time.perf_counter()
-    for _ in pool.imap_unordered(read_into_db, paths):
+    for _ in pool.imap_unordered(read_into_db, paths, chunksize=chunksize):
         counter += 1
         print("\b" * len(status_str), end="", flush=True)
         delta_t = time.perf_counter() - start_time
-        status_str = f"{{: >{len_len_paths}}}/{len_paths} {delta_t:.2f}s".format(
-            counter
-        )
+        status_str = f"{counter: >{len_len_paths}}/{len_paths} {delta_t:.2f}s"
         print(status_str, end="", flush=True)
     print("")
 
@@ -496,7 +499,7 @@ def _report() -> None:
         # Example: r13-1759-gdbb093f4f15
         # We were asked to use this style in the title and the report.
         gcc_describe_name_parts = utils.run_cmd(
-            f"git -C {repo.path} describe {case.bisection}"
+            ["git", "-C", str(repo.path), "describe", cast(str, case.bisection)]
         ).split("-")[1:]
         gcc_describe_name = "r" + "-".join(gcc_describe_name_parts)
         print(
@@ -506,7 +509,17 @@ def _report() -> None:
         # Get email to CC
         print(
             "CC to include:",
-            utils.run_cmd(f"git -C {repo.path} log -1 --format='%ae' {case.bisection}"),
+            utils.run_cmd(
+                [
+                    "git",
+                    "-C",
+                    str(repo.path),
+                    "log",
+                    "-1",
+                    "--format=%ae",
+                    cast(str, case.bisection),
+                ]
+            ),
         )
     else:
         print(
@@ -535,7 +548,11 @@ def _report() -> None:
         print()
         print(f"Bisects to: {gcc_describe_name}")
         print()
-        print(utils.run_cmd(f"git -C {repo.path} log -1 {case.bisection}"))
+        print(
+            utils.run_cmd(
+                ["git", "-C", str(repo.path), "log", "-1", cast(str, case.bisection)]
+            )
+        )
 
     else:
 
@@ -878,27 +895,29 @@ def _asm() -> None:
     ]
     good_setting = utils.get_latest_compiler_setting_from_list(bad_repo, same_opt)
 
-    asmbad = utils.get_asm_str(case.code, case.bad_setting, bldr)
-    asmgood = utils.get_asm_str(case.code, good_setting, bldr)
-    save_wrapper("asmbad", asmbad)
-    save_wrapper("asmgood", asmgood)
-
+    to_compile: dict[str, tuple[str, utils.CompilerSetting]] = {
+        "asmbad": (case.code, case.bad_setting),
+        "asmgood": (case.code, good_setting),
+    }
     if case.reduced_code:
-        reducedasmbad = utils.get_asm_str(case.reduced_code, case.bad_setting, bldr)
-        reducedasmgood = utils.get_asm_str(case.reduced_code, good_setting, bldr)
-        save_wrapper("reducedasmbad", reducedasmbad)
-        save_wrapper("reducedasmgood", reducedasmgood)
+        to_compile["reducedasmbad"] = (case.reduced_code, case.bad_setting)
+        to_compile["reducedasmgood"] = (case.reduced_code, good_setting)
     if case.bisection:
         bisection_setting = copy.deepcopy(case.bad_setting)
         bisection_setting.rev = case.bisection
 
-        asmbisect = utils.get_asm_str(case.code, bisection_setting, bldr)
-        save_wrapper("asmbisect", asmbisect)
+        to_compile["asmbisect"] = (case.code, bisection_setting)
         if case.reduced_code:
-            reducedasmbisect = utils.get_asm_str(
-                case.reduced_code, bisection_setting, bldr
-            )
-            save_wrapper("reducedasmbisect", reducedasmbisect)
+            to_compile["reducedasmbisect"] = (case.reduced_code, bisection_setting)
+
+    # The compilations are independent, run the compilers concurrently
+    with ThreadPoolExecutor(max_workers=len(to_compile)) as executor:
+        asm_futures = {
+            name: executor.submit(utils.get_asm_str, code, setting, bldr)
+            for name, (code, setting) in to_compile.items()
+        }
+        for name, future in asm_futures.items():
+            save_wrapper(name, future.result())
     print(case.marker)
 
 
@@ -1151,7 +1170,7 @@ def _edit() -> None:
         print("Did not find EDITOR variable. Using nano...", file=sys.stderr)
         subprocess.run(["nano", config.config_path])
     else:
-        subprocess.run(os.environ["EDITOR"].split(" ") + [config.config_path])
+        subprocess.run(shlex.split(os.environ["EDITOR"]) + [config.config_path])
 
 
 def _unreported() -> None:
@@ -1,8 +1,7 @@
+import hashlib
 import os
 import re
-import shutil
-import tempfile
-from pathlib import Path
+import threading
 from typing import Iterable, Optional
 
 from ccbuilder import Builder
@@ -54,76 +53,90 @@ def remove_print_hash_value(lines: Iterable[str]) -> list[str]:
     return [line for line in lines if not p.match(line)]
 
 
+# Lines which may start a top-level declaration.
+# The last two are to catch if the last of the previous patterns in the
+# file was tainted and we'd otherwise mark the rest of the file as tainted,
+# as we'll find no end in this case.
+_start_pattern = re.compile(r"extern|typedef|struct|static|void")
+_taint_pattern = re.compile(
+    "|".join(
+        (
+            r"__access__",  # LLVM doesn't know about this
+            r"__malloc__",
+            # https://gcc.gnu.org/onlinedocs/gcc/Floating-Types.html#Floating-Types
+            r"_[F|f]loat[0-9]{1,3}x{0,1}",
+            r"__asm__",  # CompCert has problems
+        )
+    )
+)
+
+
 def preprocess_lines(lines: list[str]) -> str:
-    start_patterns = [
-        re.compile(r"^extern.*"),
-        re.compile(r"^typedef.*"),
-        re.compile(r"^struct.*"),
-        # The following patterns are to catch if the last of the previous
-        # patterns in the file was tainted and we'd otherwise mark the rest
-        # of the file as tainted, as we'll find no end in this case.
-        re.compile(r"^static.*"),
-        re.compile(r"^void.*"),
-    ]
-    taint_patterns = [
-        re.compile(r".*__access__.*"),  # LLVM doesn't know about this
-        re.compile(r".*__malloc__.*"),
-        re.compile(
-            r".*_[F|f]loat[0-9]{1,3}x{0,1}.*"
-        ),  # https://gcc.gnu.org/onlinedocs/gcc/Floating-Types.html#Floating-Types
-        re.compile(r".*__asm__.*"),  # CompCert has problems
-    ]
-
-    def is_start(l: str) -> bool:
-        return any([p_start.match(l) for p_start in start_patterns])
-
-    lines_to_skip: list[int] = []
+    is_start = _start_pattern.match
+    is_tainted = _taint_pattern.search
+
+    lines_to_skip: set[int] = set()
     for i, line in enumerate(lines):
-        for p in taint_patterns:
-            if p.match(line):
-                # Searching for start of tainted region
-                up_i = i
+        if is_tainted(line):
+            # Searching for start of tainted region
+            up_i = i
+            up_line = lines[up_i]
+            while up_i > 0 and not is_start(up_line):
+                up_i -= 1
                 up_line = lines[up_i]
-                while up_i > 0 and not is_start(up_line):
-                    up_i -= 1
-                    up_line = lines[up_i]
 
-                # Searching for end of tainted region
-                down_i = i + 1
+            # Searching for end of tainted region
+            down_i = i + 1
+            down_line = lines[down_i]
+            while down_i < len(lines) and not is_start(down_line):
+                down_i += 1
                 down_line = lines[down_i]
-                while down_i < len(lines) and not is_start(down_line):
-                    down_i += 1
-                    down_line = lines[down_i]
 
-                lines_to_skip.extend(list(range(up_i, down_i)))
+            lines_to_skip.update(range(up_i, down_i))
 
     return "\n".join([line for i, line in enumerate(lines) if i not in lines_to_skip])
 
 
+def _preprocess_csmith(
+    code: str,
+    compiler_setting: utils.CompilerSetting,
+    bldr: Builder,
+) -> str:
+    additional_flags = (
+        []
+        if compiler_setting.additional_flags is None
+        else compiler_setting.additional_flags
+    )
+    # Feed the code through stdin instead of staging it in a temporary file
+    cmd = [
+        str(utils.get_compiler_executable(compiler_setting, bldr)),
+        "-x",
+        "c",
+        "-",
+        "-P",
+        "-E",
+    ] + additional_flags
+    lines = utils.run_cmd(cmd, input=code.encode("utf-8")).split("\n")
+
+    return preprocess_lines(lines)
+
+
 def preprocess_csmith_file(
     path: os.PathLike[str],
     marker_prefix: str,
     compiler_setting: utils.CompilerSetting,
     bldr: Builder,
 ) -> str:
+    with open(path, "r") as f:
+        return _preprocess_csmith(f.read(), compiler_setting, bldr)
 
-    with tempfile.NamedTemporaryFile(suffix=".c") as tf:
-        shutil.copy(path, tf.name)
-
-        additional_flags = (
-            []
-            if compiler_setting.additional_flags is None
-            else compiler_setting.additional_flags
-        )
-        cmd = [
-            str(utils.get_compiler_executable(compiler_setting, bldr)),
-            tf.name,
-            "-P",
-            "-E",
-        ] + additional_flags
-        lines = utils.run_cmd(cmd).split("\n")
 
-        return preprocess_lines(lines)
+# Preprocessing does not depend on the optimization level, so the generator
+# checking several markers of one candidate preprocesses it only once per
+# compiler and flags.
+_PREPROCESS_CACHE_SIZE = 32
+_preprocess_cache: dict[tuple[bytes, str, str, tuple[str, ...]], str] = {}
+_preprocess_cache_lock = threading.Lock()
 
 
 def preprocess_csmith_code(
@@ -143,11 +156,26 @@ def preprocess_csmith_code(
     Returns:
         Optional[str]: preprocessed code if it was able to preprocess it.
     """
-    tf = utils.save_to_tmp_file(code)
+    key = (
+        hashlib.blake2b(code.encode("utf-8")).digest(),
+        compiler_setting.compiler_project.to_string(),
+        compiler_setting.rev,
+        tuple(compiler_setting.additional_flags or ()),
+    )
+    with _preprocess_cache_lock:
+        cached = _preprocess_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        res = preprocess_csmith_file(
-            Path(tf.name), marker_prefix, compiler_setting, bldr
-        )
-        return res
+        code_pp = _preprocess_csmith(code, compiler_setting, bldr)
     except PreprocessError:
         return None
+
+    with _preprocess_cache_lock:
+        if len(_preprocess_cache) >= _PREPROCESS_CACHE_SIZE:
+            # Evict the oldest entry
+            del _preprocess_cache[next(iter(_preprocess_cache))]
+        _preprocess_cache[key] = code_pp
+
+    return code_pp
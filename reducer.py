@@ -5,7 +5,9 @@ import logging
 import os
 import random
 import shutil
+import string
 import subprocess
+import sys
 import tarfile
 import tempfile
 import time
@@ -32,8 +34,43 @@ import parsers
 import preprocessing
 import utils
 
-
 # ==================== Reducer ====================
+_checker_path = Path(__file__).parent.resolve() / "checker.py"
+
+# Interestingness test for creduce. It runs checker.py in its own interpreter,
+# instead of a shell script spawning `timeout` and a second interpreter for
+# every reduction step.
+# creduce often produces the same candidate more than once, so the outcome is
+# cached by content for the duration of a reduction.
+_check_script = string.Template("""#!$python
+import hashlib, os, runpy, signal, sys
+with open("code_pp.c", "rb") as f:
+    key = hashlib.blake2b(f.read()).hexdigest()
+outcome = os.path.join($outcome_dir, key)
+if os.path.exists(outcome):
+    with open(outcome) as f:
+        sys.exit(int(f.read()))
+# Same as `timeout 15`: kill the whole process group
+os.setpgrp()
+signal.signal(signal.SIGALRM, lambda *_: os.killpg(0, signal.SIGKILL))
+signal.alarm(15)
+sys.path.insert(0, $checker_dir)
+sys.argv = $argv
+try:
+    runpy.run_path($checker, run_name="__main__")
+    returncode = 0
+except SystemExit as e:
+    returncode = e.code if isinstance(e.code, int) else int(bool(e.code))
+signal.alarm(0)
+# Other probes may read the outcome concurrently
+tmp = f"{outcome}.{os.getpid()}"
+with open(tmp, "w") as f:
+    f.write(str(returncode))
+os.replace(tmp, outcome)
+sys.exit(returncode)
+""")
+
+
 class TempDirEnv:
     def __init__(self) -> None:
         self.td: tempfile.TemporaryDirectory[str]
@@ -166,21 +203,30 @@ class Reducer:
                 json.dump(int_settings, f)
 
             # create script for creduce
-            script_path = tmpdir / "check.sh"
+            checker_argv = [
+                str(_checker_path),
+                "--dont-preprocess",
+                "--config",
+                str(self.config.config_path),
+                "--marker",
+                marker,
+                "--interesting-settings",
+                str(settings_path),
+                "--file",
+                "code_pp.c",
+            ]
+            outcome_dir = tmpdir / "outcomes"
+            outcome_dir.mkdir()
+            script_path = tmpdir / "check.py"
             with open(script_path, "w") as f:
-                print("#/bin/sh", file=f)
-                print("TMPD=$(mktemp -d)", file=f)
-                print("trap '{ rm -rf \"$TMPD\"; }' INT TERM EXIT", file=f)
-                print(
-                    "timeout 15 "
-                    f"{Path(__file__).parent.resolve()}/checker.py"
-                    f" --dont-preprocess"
-                    f" --config {self.config.config_path}"
-                    f" --marker {marker}"
-                    f" --interesting-settings {str(settings_path)}"
-                    f" --file code_pp.c",
-                    # f' --file {str(pp_code_path)}',
-                    file=f,
+                f.write(
+                    _check_script.substitute(
+                        python=sys.executable,
+                        outcome_dir=repr(str(outcome_dir)),
+                        checker_dir=repr(str(_checker_path.parent)),
+                        checker=repr(str(_checker_path)),
+                        argv=repr(checker_argv),
+                    )
                 )
 
             os.chmod(script_path, 0o777)
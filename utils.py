@@ -3,23 +3,27 @@ from __future__ import annotations
 import argparse
 import copy
 import functools
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import re
+import shlex
 import shutil
 import stat
 import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
-from functools import reduce
 from os.path import join as pjoin
 from pathlib import Path
 from types import SimpleNamespace, TracebackType
-from typing import IO, Any, Optional, Sequence, TextIO, Union, cast
+from typing import Any, Optional, Sequence, TextIO, Union
 
 import ccbuilder
 from ccbuilder import (
@@ -27,6 +31,7 @@ from ccbuilder import (
     CompilerProject,
     BuildException,
     Repo,
+    RepositoryException,
     get_compiler_project,
 )
 
@@ -70,6 +75,18 @@ EXPECTED_ENTRIES = [
 ]
 # fmt: on
 
+# Config paths of the entries by type, for the functions handling only some types
+_PATH_ENTRIES = tuple(path for typ, path, _ in EXPECTED_ENTRIES if typ is Path)
+_EXECUTABLE_ENTRIES = tuple(
+    path for typ, path, _ in EXPECTED_ENTRIES if typ is Executable
+)
+
+# Dotted config paths, for the CLI overrides and the validation messages
+_DOTTED_ENTRIES = tuple((".".join(path), path) for _, path, _ in EXPECTED_ENTRIES)
+
+
+_IMMUTABLE_CONFIG_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 class NestedNamespace(SimpleNamespace):
     # https://stackoverflow.com/a/54332748
@@ -77,60 +94,65 @@ class NestedNamespace(SimpleNamespace):
     # can be used on.
     def __init__(self, dictionary: dict[str, Any], **kwargs: Any):
         super().__init__(**kwargs)
+        self.__dict__.update(dictionary)
         for key, value in dictionary.items():
             if isinstance(value, dict):
-                self.__setattr__(key, NestedNamespace(value))
-            else:
-                self.__setattr__(key, value)
+                self.__dict__[key] = NestedNamespace(value)
 
     def __getitem__(self, key: Union[str, Sequence[str]]) -> Any:
         if isinstance(key, str):
             return self.__dict__[key]
         assert isinstance(key, Sequence)
-        if len(key) > 1:
-            tmp = reduce(lambda x, y: x[y].__dict__, key[:-1], cast(Any, self.__dict__))
-            return tmp[key[-1]]
-        else:
-            return self.__dict__[key[0]]
+        tmp = self.__dict__
+        for k in key[:-1]:
+            tmp = tmp[k].__dict__
+        return tmp[key[-1]]
 
     def __setitem__(self, key: Union[str, Sequence[str]], value: Any) -> None:
         if isinstance(key, str):
             self.__dict__[key] = value
+            return
         assert isinstance(key, Sequence)
-        if len(key) > 1:
-            tmp = reduce(lambda x, y: x[y].__dict__, key[:-1], cast(Any, self.__dict__))
-            tmp[key[-1]] = value
-        else:
-            self.__dict__[key[0]] = value
+        tmp = self.__dict__
+        for k in key[:-1]:
+            tmp = tmp[k].__dict__
+        tmp[key[-1]] = value
 
     def __contains__(self, key: Union[str, Sequence[str]]) -> bool:
         if isinstance(key, str):
             return key in self.__dict__
         assert isinstance(key, Sequence)
-        if len(key) > 1:
-            tmp = self.__dict__
-            for k in key[:-1]:
-                if k not in tmp:
-                    return False
-                else:
-                    tmp = tmp[k].__dict__
-
-            return key[-1] in tmp
-        else:
-            return key[0] in self.__dict__
+        tmp = self.__dict__
+        for k in key[:-1]:
+            if k not in tmp:
+                return False
+            tmp = tmp[k].__dict__
+        return key[-1] in tmp
 
-    def __asdict(self) -> dict[Any, Any]:
-        d = {}
+    def __deepcopy__(self, memo: dict[Any, Any]) -> NestedNamespace:
+        # Copy the attributes directly, without rebuilding via __init__
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
         for key, value in self.__dict__.items():
-            if isinstance(value, NestedNamespace):
-                dvalue = value.__asdict()
+            # Most config values are immutable strings and numbers
+            if type(value) in _IMMUTABLE_CONFIG_TYPES:
+                new.__dict__[key] = value
             else:
-                dvalue = copy.deepcopy(value)
-            d[key] = dvalue
-        return d
+                new.__dict__[key] = copy.deepcopy(value, memo)
+        return new
 
-    def __deepcopy__(self, memo: dict[Any, Any]) -> NestedNamespace:
-        return type(self)(self.__asdict())
+
+@functools.lru_cache(maxsize=None)
+def which(executable: str) -> Optional[str]:
+    """Memoized `shutil.which`, so $PATH is only searched once per executable.
+
+    Args:
+        executable (str): Name in $PATH or path of the executable.
+
+    Returns:
+        Optional[str]: Path to the executable or None if it can't be found.
+    """
+    return shutil.which(executable)
 
 
 def validate_config(config: Union[dict[str, Any], NestedNamespace]) -> None:
@@ -143,34 +165,31 @@ def validate_config(config: Union[dict[str, Any], NestedNamespace]) -> None:
     Returns:
         None:
     """
-    key_problems = set()
+    key_problems: set[str] = set()
 
-    for exkeys in EXPECTED_ENTRIES:
-        pos = []
-        key_type = exkeys[0]
+    for (key_type, _, _), (dotted_path, path) in zip(EXPECTED_ENTRIES, _DOTTED_ENTRIES):
         tmpconfig = config
         exists = True
-        for key in exkeys[1]:
-            pos.append(key)
+        for i, key in enumerate(path):
             if key not in tmpconfig:
                 exists = False
-                s = ".".join(pos)
+                s = ".".join(path[: i + 1])
                 key_problems.add(f"Missing entry for '{s}' in config")
             else:
                 tmpconfig = tmpconfig[key]
         if exists:
             # At this point, tmpconfig should be the value in the config
-            s = ".".join(pos)
+            s = dotted_path
             if key_type is str:
                 if tmpconfig == "":  # type: ignore
                     key_problems.add(f"{s} should be a non-empty string, but is empty.")
             elif key_type is Path:
                 if not isinstance(tmpconfig, str) or tmpconfig == "":
                     key_problems.add(f"{s} should be a non-empty Path, but is empty.")
-                elif not Path(tmpconfig).exists():
+                elif not os.path.exists(tmpconfig):
                     key_problems.add(f"Path {tmpconfig} at {s} doesn't exist.")
             elif key_type is Executable:
-                if shutil.which(tmpconfig) is None:  # type: ignore
+                if which(tmpconfig) is None:  # type: ignore
                     key_problems.add(
                         f"Executable {tmpconfig} in {s} doesn't exist or is not executable."
                     )
@@ -180,34 +199,35 @@ def validate_config(config: Union[dict[str, Any], NestedNamespace]) -> None:
                         f"{s} should be a list but is not. It contains {tmpconfig} instead."
                     )
 
-                if exkeys[1][-1] == "patches":
-                    for patch in tmpconfig:  # type: ignore
-                        if not Path(pjoin("patches", patch)).exists():
+                elif path[-1] == "patches":
+                    for patch in tmpconfig:
+                        if not os.path.exists(pjoin("patches", patch)):
                             key_problems.add(f"Patch at {patch} in {s} doesn't exist")
 
     if key_problems:
         print("The config has problems:")
-        for problem in sorted(list(key_problems)):
+        for problem in sorted(key_problems):
             print(" - " + problem)
         exit(1)
 
 
 def to_absolute_paths(config: NestedNamespace) -> None:
     """
-    Convert relative paths for `Path`, `Executable` and `patches` found in config
+    Convert relative paths for `Path` and `Executable` found in config
     into absolute paths with prefix dirname __file__.
     """
-    project_dir = Path(__file__).parent
-    for typ, path_in_config, _ in EXPECTED_ENTRIES:
-        if typ is Path and not Path(config[path_in_config]).is_absolute():
-            config[path_in_config] = str(project_dir / config[path_in_config])
-        elif typ is list and "patches" in path_in_config:
-            patches = [str(project_dir / patch) for patch in config[path_in_config]]
-            config[path_in_config] = patches
-        elif typ is Executable:
-            exe = config[path_in_config]
-            if "/" in exe and not Path(exe).is_absolute():
-                config[path_in_config] = str(project_dir / config[path_in_config])
+    project_dir = os.path.dirname(__file__)
+    for path_in_config in _PATH_ENTRIES:
+        path = config[path_in_config]
+        if not os.path.isabs(path):
+            config[path_in_config] = pjoin(project_dir, path)
+    for path_in_config in _EXECUTABLE_ENTRIES:
+        exe = config[path_in_config]
+        if "/" in exe and not os.path.isabs(exe):
+            config[path_in_config] = pjoin(project_dir, exe)
+
+
+DEFAULT_CONFIG_PATH = Path.home() / ".config/dead/config.json"
 
 
 def import_config(
@@ -223,19 +243,15 @@ def import_config(
         NestedNamespace: The config
     """
     if config_path is None:
-
-        p = Path.home() / ".config/dead/config.json"
-        if p.exists():
-            config_path = p
-        else:
-            raise Exception("Found no config.json file at {p}!")
+        config_path = DEFAULT_CONFIG_PATH
         logging.debug(f"Using config found at {config_path}")
-    else:
-        if not Path(config_path).is_file():
-            raise Exception("Found no config.json file at {p}!")
 
-    with open(config_path, "r") as f:
-        config_dict = json.load(f)
+    # Opening directly checks for existence, no separate stat needed
+    try:
+        with open(config_path, "r") as f:
+            config_dict = json.load(f)
+    except (FileNotFoundError, IsADirectoryError):
+        raise Exception(f"Found no config.json file at {config_path}!")
 
     config_dict["config_path"] = str(Path(config_path).absolute())
 
@@ -247,13 +263,15 @@ def import_config(
 
     # Make sure the cache dir exists
     cache_path = Path(config.cachedir)
-    if not cache_path.exists():
-        os.makedirs(config.cachedir, exist_ok=True)
+    try:
+        cache_path.mkdir(parents=True)
         os.chmod(config.cachedir, 0o770 | stat.S_ISGID)
-    elif not (cache_path.is_dir() or cache_path.is_symlink()):
-        raise Exception(
-            f"config.cachedir {config.cachedir} already exists but is not a path or a symlink"
-        )
+    except FileExistsError:
+        cache_mode = os.lstat(cache_path).st_mode
+        if not (stat.S_ISDIR(cache_mode) or stat.S_ISLNK(cache_mode)):
+            raise Exception(
+                f"config.cachedir {config.cachedir} already exists but is not a path or a symlink"
+            )
 
     return config
 
@@ -293,8 +311,8 @@ def get_config_and_parser(
     config = import_config(args_parser.config, validate=False)
 
     # Read values from CLI and override them in config
-    for _, path, _ in EXPECTED_ENTRIES:
-        arg_val = args_parser.__dict__[".".join(path)]
+    for dotted_path, path in _DOTTED_ENTRIES:
+        arg_val = args_parser.__dict__[dotted_path]
         if arg_val is not None:
             config[path] = arg_val
 
@@ -314,13 +332,16 @@ def get_config_and_parser(
 
 
 def create_symlink(src: Path, dst: Path) -> None:
-    if dst.exists():
-        if dst.is_symlink():
+    # A single lstat tells whether dst exists and whether it is a symlink
+    try:
+        dst_mode: Optional[int] = os.lstat(dst).st_mode
+    except FileNotFoundError:
+        dst_mode = None
+    if dst_mode is not None:
+        if stat.S_ISLNK(dst_mode):
             dst.unlink()
         else:
-            dst_symlink_config = Path(
-                os.path.dirname(dst), "conflict_" + str(os.path.basename(dst))
-            )
+            dst_symlink_config = dst.with_name("conflict_" + dst.name)
 
             logging.warning(
                 f"Found non-symlink file or directory which should be a symlink: {dst}. Moving to {dst_symlink_config}..."
@@ -331,7 +352,8 @@ def create_symlink(src: Path, dst: Path) -> None:
     os.symlink(src, dst)
 
 
-@dataclass
+# Slotted: many settings are created when loading cases and scenarios
+@dataclass(slots=True)
 class CompilerSetting:
     compiler_project: CompilerProject
     rev: str
@@ -373,10 +395,11 @@ class CompilerSetting:
     def from_jsonable_dict(
         config: NestedNamespace, d: dict[str, Any]
     ) -> CompilerSetting:
+        # Settings loaded from many cases share the same few revisions
         return CompilerSetting(
             get_compiler_project(d["compiler_project"]),
-            d["rev"],
-            d["opt_level"],
+            sys.intern(d["rev"]),
+            sys.intern(d["opt_level"]),
             d["additional_flags"],
         )
 
@@ -393,11 +416,10 @@ class CompilerSetting:
             return ""
 
     def get_flag_cmd(self) -> list[str]:
-        s = self.get_flag_str()
-        if s == "":
+        # Same as splitting get_flag_str(), without building the joined string
+        if not self.additional_flags or self.additional_flags == [""]:
             return []
-        else:
-            return s.split(" ")
+        return [part for flag in self.additional_flags for part in flag.split(" ")]
 
     @staticmethod
     def from_str(s: str, config: NestedNamespace) -> CompilerSetting:
@@ -491,15 +513,13 @@ def run_cmd(
     **kwargs: Any,  # https://github.com/python/mypy/issues/8772
 ) -> str:
 
-    if working_dir is None:
-        working_dir = Path(os.getcwd())
-    env = os.environ.copy()
-    env.update(additional_env)
+    # Only copy the environment when it is modified; None inherits it
+    env = {**os.environ, **additional_env} if additional_env else None
 
     if isinstance(cmd, str):
-        cmd = cmd.strip().split(" ")
+        cmd = shlex.split(cmd)
     output = subprocess.run(
-        cmd, cwd=str(working_dir), check=True, env=env, capture_output=True, **kwargs
+        cmd, cwd=working_dir, check=True, env=env, capture_output=True, **kwargs
     )
 
     res: str = output.stdout.decode("utf-8").strip()
@@ -513,13 +533,10 @@ def run_cmd_to_logfile(
     additional_env: dict[str, str] = {},
 ) -> None:
 
-    if working_dir is None:
-        working_dir = Path(os.getcwd())
-    env = os.environ.copy()
-    env.update(additional_env)
+    env = {**os.environ, **additional_env} if additional_env else None
 
     if isinstance(cmd, str):
-        cmd = cmd.strip().split(" ")
+        cmd = shlex.split(cmd)
 
     subprocess.run(
         cmd,
@@ -528,27 +545,38 @@ def run_cmd_to_logfile(
         stdout=log_file,
         stderr=subprocess.STDOUT,
         env=env,
-        capture_output=False,
     )
 
 
-def find_include_paths(clang: str, file: str, flags: str) -> list[str]:
-    cmd = [clang, file, "-c", "-o/dev/null", "-v"]
+def find_include_paths(clang: str, flags: str) -> list[str]:
+    """Get the include search paths of `clang` when used with `flags`.
+    They do not depend on the code being compiled, so they are probed once
+    per (clang, flags) with an empty file and cached.
+
+    Args:
+        clang (str): Path to clang executable or name in $PATH.
+        flags (str): Flags to be used when compiling.
+
+    Returns:
+        list[str]: The include search paths.
+    """
+    return list(_find_include_paths(clang, flags))
+
+
+@functools.lru_cache(maxsize=16)
+def _find_include_paths(clang: str, flags: str) -> tuple[str, ...]:
+    cmd = [clang, "-x", "c", "/dev/null", "-c", "-o/dev/null", "-v"]
     if flags:
         cmd.extend(flags.split())
     result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     assert result.returncode == 0
-    output = result.stdout.decode("utf-8").split("\n")
-    start = (
-        next(
-            i
-            for i, line in enumerate(output)
-            if "#include <...> search starts here:" in line
-        )
-        + 1
+    output = result.stdout
+    start = output.index(b"#include <...> search starts here:")
+    start = output.index(b"\n", start) + 1
+    end = output.index(b"End of search list.", start)
+    return tuple(
+        line.strip().decode("utf-8") for line in output[start:end].splitlines()
     )
-    end = next(i for i, line in enumerate(output) if "End of search list." in line)
-    return [output[i].strip() for i in range(start, end)]
 
 
 def get_scenario(config: NestedNamespace, args: argparse.Namespace) -> Scenario:
@@ -595,21 +623,23 @@ def get_marker_prefix(marker: str) -> str:
     return marker.rstrip("_").rstrip("0123456789")
 
 
+_OPT_LEVELS = frozenset(("1", "2", "3", "s", "z"))
+
+
 def get_compiler_settings(
     config: NestedNamespace, args: list[str], default_opt_levels: list[str]
 ) -> list[CompilerSetting]:
     settings: list[CompilerSetting] = []
 
-    possible_opt_levels = ["1", "2", "3", "s", "z"]
-
+    repodir = Path(config.repodir)
     pos = 0
-    while len(args[pos:]) > 1:
-        compiler_project, repo = ccbuilder.get_compiler_info(args[pos], Path(config.repodir))  # type: ignore
+    while len(args) - pos > 1:
+        compiler_project, repo = ccbuilder.get_compiler_info(args[pos], repodir)  # type: ignore
         rev = repo.rev_to_commit(args[pos + 1])
         pos += 2
 
         opt_levels: set[str] = set(default_opt_levels)
-        while pos < len(args) and args[pos] in possible_opt_levels:
+        while pos < len(args) and args[pos] in _OPT_LEVELS:
             opt_levels.add(args[pos])
             pos += 1
 
@@ -625,29 +655,50 @@ def get_compiler_settings(
     return settings
 
 
-def save_to_tmp_file(content: str) -> IO[bytes]:
-    ntf = tempfile.NamedTemporaryFile()
-    with open(ntf.name, "w") as f:
+def save_to_file(path: Path, content: str) -> None:
+    with open(path, "w") as f:
         f.write(content)
 
-    return ntf
 
+def add_str_to_tar(tf: tarfile.TarFile, member: str, content: str) -> None:
+    """Add `content` as file `member` to the archive, without a temporary file.
+
+    Args:
+        tf (tarfile.TarFile): Archive opened for writing.
+        member (str): Name of the file in the archive.
+        content (str): Content of the file.
+
+    Returns:
+        None:
+    """
+    data = content.encode("utf-8")
+    info = tarfile.TarInfo(member)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tf.addfile(info, io.BytesIO(data))
 
-def save_to_file(path: Path, content: str) -> None:
-    with open(path, "w") as f:
-        f.write(content)
 
+def read_tar_members(tf: tarfile.TarFile) -> dict[str, str]:
+    """Read all regular files of the archive in a single pass over it.
 
-def check_and_get(tf: tarfile.TarFile, member: str) -> str:
+    Args:
+        tf (tarfile.TarFile): Archive opened for reading.
+
+    Returns:
+        dict[str, str]: Stripped content of the files by member name.
+    """
+    return {
+        info.name: f.read().decode("utf-8").strip()
+        for info in tf
+        if (f := tf.extractfile(info)) is not None
+    }
+
+
+def check_and_get(members: dict[str, str], member: str) -> str:
     try:
-        f = tf.extractfile(member)
+        return members[member]
     except KeyError:
         raise FileExistsError(f"File does not include member {member}!")
-    if not f:
-        raise FileExistsError(f"File does not include member {member}!")
-    res = f.read().decode("utf-8").strip()
-
-    return res
 
 
 def get_interesting_settings(
@@ -714,12 +765,13 @@ class Case:
     @staticmethod
     def from_file(config: NestedNamespace, file: Path) -> Case:
         with tarfile.open(file, "r") as tf:
+            members = read_tar_members(tf)
 
-            names = tf.getnames()
-
-            code = check_and_get(tf, "code.c")
-            marker = check_and_get(tf, "marker.txt")
-            int_settings = json.loads(check_and_get(tf, "interesting_settings.json"))
+            code = check_and_get(members, "code.c")
+            marker = check_and_get(members, "marker.txt")
+            int_settings = json.loads(
+                check_and_get(members, "interesting_settings.json")
+            )
             bad_setting = CompilerSetting.from_jsonable_dict(
                 config, int_settings["bad_setting"]
             )
@@ -729,19 +781,19 @@ class Case:
             ]
 
             scenario = Scenario.from_jsonable_dict(
-                config, json.loads(check_and_get(tf, "scenario.json"))
+                config, json.loads(check_and_get(members, "scenario.json"))
             )
             reduced_code = None
-            if "reduced_code_0.c" in names:
-                reduced_code = check_and_get(tf, "reduced_code_0.c")
+            if "reduced_code_0.c" in members:
+                reduced_code = check_and_get(members, "reduced_code_0.c")
 
             bisection = None
-            if "bisection_0.txt" in names:
-                bisection = check_and_get(tf, "bisection_0.txt")
+            if "bisection_0.txt" in members:
+                bisection = check_and_get(members, "bisection_0.txt")
 
             # "Legacy support"
             try:
-                timestamp = float(check_and_get(tf, "timestamp.txt"))
+                timestamp = float(check_and_get(members, "timestamp.txt"))
             except FileExistsError:
                 timestamp = file.stat().st_mtime
 
@@ -758,36 +810,28 @@ class Case:
             )
 
     def to_file(self, file: Path) -> None:
-        with tarfile.open(file, "w") as tf:
-            ntf = save_to_tmp_file(self.code)
+        with tarfile.open(file, "w|") as tf:
+            add_str_to_tar(tf, "code.c", self.code)
 
-            tf.add(ntf.name, "code.c")
-
-            ntf = save_to_tmp_file(self.marker)
-            tf.add(ntf.name, "marker.txt")
+            add_str_to_tar(tf, "marker.txt", self.marker)
 
             int_settings: dict[str, Any] = {}
             int_settings["bad_setting"] = self.bad_setting.to_jsonable_dict()
             int_settings["good_settings"] = [
                 gs.to_jsonable_dict() for gs in self.good_settings
             ]
-            ntf = save_to_tmp_file(json.dumps(int_settings))
-            tf.add(ntf.name, "interesting_settings.json")
+            add_str_to_tar(tf, "interesting_settings.json", json.dumps(int_settings))
 
             scenario_str = json.dumps(self.scenario.to_jsonable_dict())
-            ntf = save_to_tmp_file(scenario_str)
-            tf.add(ntf.name, "scenario.json")
+            add_str_to_tar(tf, "scenario.json", scenario_str)
 
-            ntf = save_to_tmp_file(str(self.timestamp))
-            tf.add(ntf.name, "timestamp.txt")
+            add_str_to_tar(tf, "timestamp.txt", str(self.timestamp))
 
             if self.reduced_code:
-                ntf = save_to_tmp_file(self.reduced_code)
-                tf.add(ntf.name, "reduced_code_0.c")
+                add_str_to_tar(tf, "reduced_code_0.c", self.reduced_code)
 
             if self.bisection:
-                ntf = save_to_tmp_file(self.bisection)
-                tf.add(ntf.name, "bisection_0.txt")
+                add_str_to_tar(tf, "bisection_0.txt", self.bisection)
 
     def to_jsonable_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {}
@@ -842,17 +886,76 @@ def get_latest_compiler_setting_from_list(
 
     Returns:
         CompilerSetting: Compiler closest to main
+
+    Raises:
+        ValueError: Raised when `l` is empty.
     """
+    if not l:
+        raise ValueError("Can't get the latest compiler setting of an empty list")
+
+    # Compute the branch point wrt main once per revision instead of once per
+    # comparison (is_branch_point_ancestor_wrt_master recomputes both sides).
+    main_commit = repo.rev_to_commit(repo.main_branch)
+    branch_points = {
+        setting.rev: repo.get_best_common_ancestor(main_commit, setting.rev)
+        for setting in l
+    }
+
+    # The newest branch points are the ones which are no ancestor of any other.
+    # One `git merge-base --independent` finds them, instead of one
+    # `git merge-base --is-ancestor` per comparison of a sort.
+    unique_branch_points = list(dict.fromkeys(branch_points.values()))
+    if len(unique_branch_points) > 1:
+        newest = set(
+            run_cmd(
+                [
+                    "git",
+                    "-C",
+                    str(repo.path),
+                    "merge-base",
+                    "--independent",
+                    *unique_branch_points,
+                ]
+            ).split()
+        )
+    else:
+        newest = set(unique_branch_points)
 
-    def cmp_func(a: CompilerSetting, b: CompilerSetting) -> int:
-        if a.rev == b.rev:
-            return 0
-        if repo.is_branch_point_ancestor_wrt_master(a.rev, b.rev):
-            return -1
-        else:
-            return 1
+    return next(setting for setting in l if branch_points[setting.rev] in newest)
 
-    return max(l, key=functools.cmp_to_key(cmp_func))
+
+def count_first_parent_path(repo: Repo, older: str, younger: str) -> int:
+    """Get the length of `Repo.direct_first_parent_path(older, younger)`
+    without listing all the commits in it.
+
+    Args:
+        repo (Repo): Repository the revisions are in
+        older (str): Older revision
+        younger (str): Younger revision
+
+    Returns:
+        int: Amount of commits in [younger, older] following the first parent.
+
+    Raises:
+        RepositoryException: If git can't resolve one of the revisions.
+    """
+    try:
+        res = run_cmd(
+            [
+                "git",
+                "-C",
+                str(repo.path),
+                "rev-list",
+                "--count",
+                "--first-parent",
+                younger,
+                f"^{older}",
+            ]
+        )
+    except subprocess.CalledProcessError as e:
+        raise RepositoryException(e)
+    # direct_first_parent_path also includes `older`
+    return int(res) + 1
 
 
 # =================== Builder Helper ====================
@@ -867,12 +970,23 @@ class CompileError(Exception):
     pass
 
 
+# The alive markers only depend on the code and the compiler setting, so they
+# are cached by the hash of the code. The generator checks several markers and
+# bad settings of one candidate with Checker.is_interesting, and each check
+# compiles the same preprocessed code with the same settings again.
+_ALIVE_MARKERS_CACHE_SIZE = 256
+_alive_markers_cache: dict[
+    tuple[bytes, str, str, str, tuple[str, ...], str], frozenset[str]
+] = {}
+_alive_markers_cache_lock = threading.Lock()
+
+
 def find_alive_markers(
     code: str,
     compiler_setting: CompilerSetting,
     marker_prefix: str,
     bldr: Builder,
-) -> set[str]:
+) -> frozenset[str]:
     """Return set of markers which are found in the assembly.
 
     Args:
@@ -882,27 +996,73 @@ def find_alive_markers(
         bldr (Builder): Builder to get the compiler
 
     Returns:
-        set[str]: Set of markers found in the assembly i.e. alive markers
+        frozenset[str]: Set of markers found in the assembly i.e. alive markers
 
     Raises:
         CompileError: Raised when code can't be compiled.
     """
-    alive_markers = set()
+    key = (
+        hashlib.blake2b(code.encode("utf-8")).digest(),
+        compiler_setting.compiler_project.to_string(),
+        compiler_setting.rev,
+        compiler_setting.opt_level,
+        tuple(compiler_setting.additional_flags or ()),
+        marker_prefix,
+    )
+    with _alive_markers_cache_lock:
+        cached = _alive_markers_cache.get(key)
+    if cached is not None:
+        return cached
 
-    # Extract alive markers
-    alive_regex = re.compile(f".*[call|jmp].*{marker_prefix}([0-9]+)_.*")
+    compiler_exe = get_compiler_executable(compiler_setting, bldr)
 
-    asm = get_asm_str(code, compiler_setting, bldr)
+    with CompileContext(code) as context_res:
+        code_file, asm_file = context_res
+        _compile_to_asm(compiler_exe, compiler_setting, code_file, asm_file)
+
+        # Extract alive markers, scanning the memory-mapped assembly at once
+        # and only decoding the marker numbers
+        alive_regex = _alive_marker_regex(marker_prefix)
+        with open(asm_file, "rb") as f:
+            # mmap can't map empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                alive_markers: frozenset[str] = frozenset()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    alive_markers = frozenset(
+                        f"{marker_prefix}{m.group(1).decode()}_"
+                        for m in alive_regex.finditer(mm)
+                    )
 
-    for line in asm.split("\n"):
-        line = line.strip()
-        m = alive_regex.match(line)
-        if m:
-            alive_markers.add(f"{marker_prefix}{m.group(1)}_")
+    with _alive_markers_cache_lock:
+        if len(_alive_markers_cache) >= _ALIVE_MARKERS_CACHE_SIZE:
+            # Evict the oldest entry
+            del _alive_markers_cache[next(iter(_alive_markers_cache))]
+        _alive_markers_cache[key] = alive_markers
 
     return alive_markers
 
 
+@functools.lru_cache(maxsize=16)
+def _alive_marker_regex(marker_prefix: str) -> re.Pattern[bytes]:
+    # At most one match per line, as when matching the lines one by one.
+    return re.compile(
+        rb"^.*[call|jmp].*" + marker_prefix.encode() + rb"([0-9]+)_", re.MULTILINE
+    )
+
+
+def get_compile_tmpdir() -> Optional[str]:
+    """Get the directory for the temporary files of `CompileContext`.
+    It can be pointed to a RAM-backed directory such as /dev/shm via
+    $DEAD_TMPDIR. This is not the default because creduce kills the checker
+    with SIGKILL, which leaves the files behind.
+
+    Returns:
+        Optional[str]: $DEAD_TMPDIR or None for the default temporary directory.
+    """
+    return os.environ.get("DEAD_TMPDIR")
+
+
 class CompileContext:
     def __init__(self, code: str):
         self.code = code
@@ -912,10 +1072,12 @@ class CompileContext:
         self.asm_file: Optional[str] = None
 
     def __enter__(self) -> tuple[str, str]:
-        self.fd_code, self.code_file = tempfile.mkstemp(suffix=".c")
-        self.fd_asm, self.asm_file = tempfile.mkstemp(suffix=".s")
+        tmpdir = get_compile_tmpdir()
+        self.fd_code, self.code_file = tempfile.mkstemp(suffix=".c", dir=tmpdir)
+        self.fd_asm, self.asm_file = tempfile.mkstemp(suffix=".s", dir=tmpdir)
 
-        with open(self.code_file, "w") as f:
+        # Write through the descriptor mkstemp already opened
+        with open(self.fd_code, "w", closefd=False) as f:
             f.write(self.code)
 
         return (self.code_file, self.asm_file)
@@ -931,13 +1093,59 @@ class CompileContext:
             os.close(self.fd_code)
             # In case of a CompileError,
             # the file itself might not exist.
-            if Path(self.asm_file).exists():
+            try:
                 os.remove(self.asm_file)
+            except FileNotFoundError:
+                pass
             os.close(self.fd_asm)
         else:
             raise BuildException("Compier context exited but was not entered")
 
 
+def _compile_to_asm(
+    compiler_exe: Path, compiler_setting: CompilerSetting, code_file: str, asm_file: str
+) -> None:
+    cmd = [
+        str(compiler_exe),
+        "-S",
+        code_file,
+        f"-o{asm_file}",
+        f"-O{compiler_setting.opt_level}",
+    ]
+    cmd += compiler_setting.get_flag_cmd()
+    try:
+        run_cmd(cmd)
+    except subprocess.CalledProcessError:
+        raise CompileError()
+
+
+def _compile_piped(
+    compiler_exe: Path,
+    compiler_setting: CompilerSetting,
+    code: str,
+    output_flags: list[str],
+) -> str:
+    # Feed the code through stdin and read the output from stdout,
+    # no temporary files are needed.
+    cmd = [
+        str(compiler_exe),
+        *output_flags,
+        "-x",
+        "c",
+        "-",
+        "-o-",
+        f"-O{compiler_setting.opt_level}",
+    ]
+    cmd += compiler_setting.get_flag_cmd()
+    try:
+        output = subprocess.run(
+            cmd, input=code.encode("utf-8"), check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError:
+        raise CompileError()
+    return output.stdout.decode("utf-8")
+
+
 def get_asm_str(code: str, compiler_setting: CompilerSetting, bldr: Builder) -> str:
     """Get assembly of `code` compiled by `compiler_setting`.
 
@@ -953,23 +1161,48 @@ def get_asm_str(code: str, compiler_setting: CompilerSetting, bldr: Builder) ->
         CompileError: Is raised when compilation failes i.e. has a non-zero exit code.
     """
     # Get the assembly output of `code` compiled with `compiler_setting` as str
+    compiler_exe = get_compiler_executable(compiler_setting, bldr)
+    return _compile_piped(compiler_exe, compiler_setting, code, ["-S"])
+
+
+def is_marker_in_asm(
+    code: str, compiler_setting: CompilerSetting, marker: str, bldr: Builder
+) -> bool:
+    """Check if `marker` appears in the assembly of `code` compiled by
+    `compiler_setting`. The assembly file is searched as memory-mapped bytes
+    instead of being read and decoded as a whole.
+
+    Args:
+        code (str): Code to compile to assembly
+        compiler_setting (utils.CompilerSetting): Compiler to use
+        marker (str): Marker to search for
+        bldr (Builder): Builder to get the compiler
+
+    Returns:
+        bool: True if `marker` is found in the assembly.
+
+    Raises:
+        CompileError: Is raised when compilation failes i.e. has a non-zero exit code.
+    """
 
     compiler_exe = get_compiler_executable(compiler_setting, bldr)
 
     with CompileContext(code) as context_res:
         code_file, asm_file = context_res
+        _compile_to_asm(compiler_exe, compiler_setting, code_file, asm_file)
+
+        with open(asm_file, "rb") as f:
+            # mmap can't map empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(marker.encode("utf-8")) != -1
 
-        cmd = f"{compiler_exe} -S {code_file} -o{asm_file} -O{compiler_setting.opt_level}".split(
-            " "
-        )
-        cmd += compiler_setting.get_flag_cmd()
-        try:
-            run_cmd(cmd)
-        except subprocess.CalledProcessError:
-            raise CompileError()
 
-        with open(asm_file, "r") as f:
-            return f.read()
+# Once built, a compiler stays at the same place in the cache, so the lookup
+# (a rev-parse and a few stats done by the builder) is only needed once.
+_compiler_executable_cache: dict[tuple[str, str, str], Path] = {}
+_compiler_executable_cache_lock = threading.Lock()
 
 
 def get_compiler_executable(compiler_setting: CompilerSetting, bldr: Builder) -> Path:
@@ -982,17 +1215,35 @@ def get_compiler_executable(compiler_setting: CompilerSetting, bldr: Builder) ->
     Returns:
         Path: Path to compiler binary
     """
-    return bldr.build(
+    key = (
+        str(bldr.cache_prefix),
+        compiler_setting.compiler_project.to_string(),
+        compiler_setting.rev,
+    )
+    with _compiler_executable_cache_lock:
+        cached = _compiler_executable_cache.get(key)
+    if cached is not None:
+        return cached
+
+    compiler_exe = bldr.build(
         compiler_setting.compiler_project, compiler_setting.rev, get_executable=True
     )
+    with _compiler_executable_cache_lock:
+        _compiler_executable_cache[key] = compiler_exe
+    return compiler_exe
 
 
 def get_verbose_compiler_info(compiler_setting: CompilerSetting, bldr: Builder) -> str:
     cpath = get_compiler_executable(compiler_setting, bldr)
+    return _compiler_banner(str(cpath))
 
+
+@functools.lru_cache(maxsize=None)
+def _compiler_banner(compiler_exe: str) -> str:
+    # Only depends on the (immutable, cached) compiler binary
     return (
         subprocess.run(
-            f"{cpath} -v".split(),
+            [compiler_exe, "-v"],
             stderr=subprocess.STDOUT,
             stdout=subprocess.PIPE,
         )
@@ -1009,18 +1260,4 @@ def get_llvm_IR(code: str, compiler_setting: CompilerSetting, bldr: Builder) ->
         raise CompileError("Requesting LLVM IR from non-clang compiler!")
 
     compiler_exe = get_compiler_executable(compiler_setting, bldr)
-
-    with CompileContext(code) as context_res:
-        code_file, asm_file = context_res
-
-        cmd = f"{compiler_exe} -emit-llvm -S {code_file} -o{asm_file} -O{compiler_setting.opt_level}".split(
-            " "
-        )
-        cmd += compiler_setting.get_flag_cmd()
-        try:
-            run_cmd(cmd)
-        except subprocess.CalledProcessError:
-            raise CompileError()
-
-        with open(asm_file, "r") as f:
-            return f.read()
+    return _compile_piped(compiler_exe, compiler_setting, code, ["-emit-llvm", "-S"])